@@ -5,8 +5,16 @@ Assimilate Example - Project Browser
 """
 
 from __future__ import absolute_import
+import contextlib
+import hashlib
+import io
+import operator
 import os
+import shutil
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -14,7 +22,7 @@ from pathlib import Path
 try:
     from assimilate_client import *
     from assimilate_client.api import *
-    from assimilate_client.models import *
+    from assimilate_client.models import DeleteMediaData, ImageSnapshot, PlaymodeData
     from assimilate_client.rest import *
 except ImportError as e:
     print(f"Error importing assimilate_client: {e}")
@@ -31,6 +39,54 @@ def safe_get_attr(obj, attr_name, default=None):
     return getattr(obj, attr_name, default)
 
 
+# Rendered thumbnails, reused while the shot and the server build don't change
+THUMBNAIL_CACHE_DIR = Path.home() / ".cache" / "assimilate" / "thumbnails"
+# Cached thumbnails kept, the least recently used are removed first
+THUMBNAIL_CACHE_MAX_ENTRIES = 500
+
+# Fields copied from each shot model into the shot infos
+_SHOT_FIELDS = ('uuid', 'name', 'file', 'length', 'timecode')
+_SHOT_GET = operator.attrgetter(*_SHOT_FIELDS)
+
+# Render queue status icons
+_STATUS_ICONS = {
+    "Idle": "⚪",
+    "waiting": "⏸️",
+    "processing": "🔄",
+    "finished": "✅",
+    "error": "❌"
+}
+
+# Seconds a fetched construct is reused before it is requested again
+CONSTRUCT_CACHE_TTL = 5
+
+
+def _replace_file(path, src):
+    """Copy the file object src to path through a unique temp file"""
+    tmp = tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False)
+    try:
+        with tmp:
+            shutil.copyfileobj(src, tmp)
+        os.replace(tmp.name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp.name)
+        raise
+
+
+def _prune_thumbnail_cache():
+    """Remove the least recently used thumbnails beyond the cache size"""
+    entries = []
+    for meta_path in THUMBNAIL_CACHE_DIR.glob("*.json"):
+        with contextlib.suppress(OSError):
+            entries.append((meta_path.stat().st_mtime, meta_path))
+    entries.sort()
+    for _, meta_path in entries[:-THUMBNAIL_CACHE_MAX_ENTRIES]:
+        for path in THUMBNAIL_CACHE_DIR.glob(f"{meta_path.stem}.*"):
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+
 class AssimilateProjectExplorer:
     def __init__(self, host="http://localhost:8080/APIV2"):
         # Swagger configuration
@@ -50,6 +106,17 @@ class AssimilateProjectExplorer:
         self.current_project = None
         self.current_group = None
         self.current_construct = None
+        
+        # System properties don't change while the server runs
+        self._system_info = None
+        # (fetch time, construct) of the last level=ALL construct request
+        self._construct_cache = None
+        # Groups of the last get_groups() call, indexed by name
+        self._groups_by_name = {}
+        # Shot models of the last get_all_shots() call, indexed by uuid
+        self._shots_by_uuid = {}
+        # Whether a project is known to be open on the server
+        self._in_project = False
 
     # ============================================================
     # STEP 2: Find Last opened project (if any)
@@ -62,11 +129,13 @@ class AssimilateProjectExplorer:
             current = self.projects_api.get_projects_current()
             project_name = current.name
             
-            self.application_api.do_application_project_exit()
+            # Keep it open, enter_project() won't need to reopen it
+            self.current_project = current
+            self._in_project = True
             print (f"   ✅ {project_name}")
             return project_name
         except ApiException as e:
-            pass # no current project is open
+            self._in_project = False # no current project is open
         
         projects = self.projects_api.get_projects().projects
         projects.sort(
@@ -82,11 +151,21 @@ class AssimilateProjectExplorer:
     # ============================================================
     # STEP 1: Retrieve system information
     # ============================================================
-    def get_system_info(self):
-        """Retrieve system settings"""
+    def _system_properties(self, refresh=False):
+        """System properties, only fetched from the server once"""
+        if self._system_info is None or refresh:
+            self._system_info = self.system_api.get_system_properties()
+        return self._system_info
+
+    def get_system_info(self, refresh=False):
+        """Retrieve system settings
+        
+        Args:
+            refresh: Query the server even if the properties are cached
+        """
         print("\n🔧 Retrieving system info...")
         try:
-            system = self.system_api.get_system_properties()
+            system = self._system_properties(refresh=refresh)
             print(f"   System name: {system.system_name}")
             print(f"   Software version: {system.version} "
                   f"(build {system.build})")
@@ -95,7 +174,7 @@ class AssimilateProjectExplorer:
             return system
         except ApiException as e:
             if e.body:
-                error_dict = json.loads(e.body.decode('utf-8'))
+                error_dict = json.loads(e.body)
                 print(f"❌ API Error: {json.dumps(error_dict, indent=4)}")
             raise
 
@@ -104,16 +183,22 @@ class AssimilateProjectExplorer:
     # ============================================================
     def list_projects(self):
         """List all available projects"""
+        return self._show_projects(self.projects_api.get_projects)
+
+    def _show_projects(self, fetch_projects):
+        """Print the projects returned by fetch_projects()"""
         print("\n📁 Retrieving projects...")
         try:
-            projects = self.projects_api.get_projects().projects
+            projects = fetch_projects().projects
             
-            for proj in projects:
-                print(f"   - {proj.name} (last modified: {proj.modified})")
+            lines = [f"   - {proj.name} (last modified: {proj.modified})"
+                     for proj in projects]
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
             return projects
         except ApiException as e:
             if e.body:
-                error_dict = json.loads(e.body.decode('utf-8'))
+                error_dict = json.loads(e.body)
                 print(f"❌ Error retrieving projects: {json.dumps(error_dict, indent=4)}")
             return []
     
@@ -122,15 +207,28 @@ class AssimilateProjectExplorer:
         
         
         print(f"\n🎬 Opening project '{project_name}'...")
+        self._construct_cache = None
         try:
+            if self._in_project:
+                if self.current_project and self.current_project.name == project_name:
+                    print(f"   ✅ Current project: {project_name} (already open)")
+                    return self.current_project
+                self.application_api.do_application_project_exit()
+                self._in_project = False
+            # Only set again once get_projects_current() confirms the project,
+            # so a failure below can't leave the previous one marked as open
+            self.current_project = None
+            
             self.application_api.do_application_project_enter(project_name)
+            self._in_project = True
             
             current = self.projects_api.get_projects_current()
+            self.current_project = current
             print(f"   ✅ Current project: {current.name}")
             return current
         except ApiException as e:
             if e.body:
-                error_dict = json.loads(e.body.decode('utf-8'))
+                error_dict = json.loads(e.body)
                 print(f"❌ Error opening project: {json.dumps(error_dict, indent=4)}")
 
             raise
@@ -144,6 +242,8 @@ class AssimilateProjectExplorer:
         try:
             level = "ALL" if detailed else ""
             groups = self.projects_api.get_groups(level = level).groups
+            # Reversed, so the first group wins when names are duplicated
+            self._groups_by_name = {g.name: g for g in reversed(groups)}
             print(f"   {len(groups)} group(s) found:")
             for group in groups:
                 name = group.name
@@ -156,13 +256,14 @@ class AssimilateProjectExplorer:
             return groups
         except ApiException as e:
             if e.body:
-                error_dict = json.loads(e.body.decode('utf-8'))
+                error_dict = json.loads(e.body)
                 print(f"❌ Error retrieving groups: {json.dumps(error_dict, indent=4)}")
             return []
     
     def select_group(self, group_uuid):
         """Activate a specific group"""
         print(f"\n👉 Selecting group...")
+        self._construct_cache = None
         try:
             # Swagger: post_group to select
             result = self.projects_api.select_group(group_uuid, level="ALL")
@@ -172,7 +273,7 @@ class AssimilateProjectExplorer:
             return result
         except ApiException as e:
             if e.body:
-                error_dict = json.loads(e.body.decode('utf-8'))
+                error_dict = json.loads(e.body)
                 print(f"❌ Error selecting group: {json.dumps(error_dict, indent=4)}")
             raise
 
@@ -185,6 +286,7 @@ class AssimilateProjectExplorer:
         try:
             construct = self.projects_api.get_constructs_current(level="ALL")
             self.current_construct = construct
+            self._construct_cache = (time.monotonic(), construct)
             
             resolution = construct.resolution
             fps = construct.fps
@@ -198,43 +300,157 @@ class AssimilateProjectExplorer:
             return construct
         except ApiException as e:
             if e.body:
-                error_dict = json.loads(e.body.decode('utf-8'))
+                error_dict = json.loads(e.body)
                 print(f"❌ Error retrieving construct: {json.dumps(error_dict, indent=4)}")
             raise
     
+    def _collect_shots(self, construct):
+        """Flatten the slots and shots of a construct into shot infos"""
+        # With level=ALL the construct already holds every slot with its
+        # shots, so this needs no further requests per slot or shot
+        all_shots = []
+        lines = []
+        shots_by_uuid = {}
+        
+        slots = safe_get_attr(construct, 'slots', [])
+        for slot_idx, slot in enumerate(slots):
+            slot_shots = safe_get_attr(slot, 'shots', [])
+            for version_idx, shot in enumerate(slot_shots):
+                # Shots are always models here, fetch all fields in one call
+                shot_info = dict(zip(_SHOT_FIELDS, _SHOT_GET(shot)))
+                shot_info['slot_idx'] = slot_idx
+                shot_info['version_idx'] = version_idx
+                all_shots.append(shot_info)
+                shots_by_uuid[shot_info['uuid']] = shot
+                lines.append(f"   Slot {slot_idx}, Version {version_idx}: {shot_info['name']} "
+                             f"({shot_info['length']} frames)")
+        # One write for the whole listing instead of a print per shot
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+        self._shots_by_uuid = shots_by_uuid
+        return all_shots
+    
     def get_all_shots(self):
         """Retrieve all shots from the current timeline"""
         print("\n🎬 Collecting shots...")
         try:
-            construct = self.projects_api.get_constructs_current(level="ALL")
-            all_shots = []
-            
-            slots = safe_get_attr(construct, 'slots', [])
-            for slot_idx, slot in enumerate(slots):
-                slot_shots = safe_get_attr(slot, 'shots', [])
-                for version_idx, shot in enumerate(slot_shots):
-                    shot_info = {
-                        'uuid': shot.uuid,
-                        'name': shot.name,
-                        'slot_idx': slot_idx,
-                        'version_idx': version_idx,
-                        'file': shot.file,
-                        'length': shot.length,
-                        'timecode': safe_get_attr(shot, 'timecode', '00:00:00:00')
-                    }
-                    all_shots.append(shot_info)
-                    print(f"   Slot {slot_idx}, Version {version_idx}: {shot_info['name']} "
-                          f"({shot_info['length']} frames)")
+            # Single round trip for all slots and shots, reuse the construct
+            # if get_current_construct() just fetched it
+            if (self._construct_cache and
+                    time.monotonic() - self._construct_cache[0] < CONSTRUCT_CACHE_TTL):
+                construct = self._construct_cache[1]
+            else:
+                construct = self.projects_api.get_constructs_current(level="ALL")
+            all_shots = self._collect_shots(construct)
             
             print(f"   Total: {len(all_shots)} shot(s) found")
             return all_shots
             
         except ApiException as e:
             if e.body:
-                error_dict = json.loads(e.body.decode('utf-8'))
+                error_dict = json.loads(e.body)
                 print(f"❌ Error collecting shots: {json.dumps(error_dict, indent=4)}")
             return []
 
+    def _snapshot_request(self, shot_uuid, frame=0):
+        """Build the snapshot request body for a shot"""
+        # Use ImageSnapshot model
+        return ImageSnapshot(
+            uuid=shot_uuid,
+            frame=frame,
+            proxy=True,
+            mime_type = "image/png"
+            #file=output_path
+            # Note: The API support direct file output, if 'file' is not pressent in ImageSnapShot we will handle the binary response ourselves
+        )
+
+    def _thumbnail_cache_key(self, snapshot):
+        """Cache key of a snapshot request, None if the shot state is unknown"""
+        # The snapshot is the graded image, so the key covers the whole shot
+        # state (grade, framing, ...) from the last get_all_shots()
+        shot = self._shots_by_uuid.get(snapshot.uuid)
+        if shot is None:
+            return None
+        state = json.dumps(shot.to_dict(), sort_keys=True, default=str)
+        key = f"{snapshot.uuid}|{snapshot.frame}|{snapshot.proxy}|{state}"
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+    def _load_cached_thumbnail(self, snapshot, output_path):
+        """Copy a cached render to output_path, returns None on a cache miss"""
+        key = self._thumbnail_cache_key(snapshot)
+        if key is None:
+            return None
+        try:
+            meta_path = THUMBNAIL_CACHE_DIR / f"{key}.json"
+            meta = json.loads(meta_path.read_bytes())
+            if meta.get('build') != self._system_properties().build:
+                return None
+            output_path = Path(output_path).with_suffix(meta['suffix'])
+            shutil.copyfile(THUMBNAIL_CACHE_DIR / f"{key}{meta['suffix']}", output_path)
+            # Mark the entry as recently used for _prune_thumbnail_cache()
+            os.utime(meta_path)
+            return output_path
+        except (OSError, ValueError, KeyError, ApiException):
+            return None
+
+    def _store_cached_thumbnail(self, snapshot, image_path):
+        """Add a rendered thumbnail to the cache"""
+        key = self._thumbnail_cache_key(snapshot)
+        if key is None:
+            return
+        suffix = Path(image_path).suffix
+        try:
+            build = self._system_properties().build
+        except ApiException as e:
+            # The image is already saved, only skip caching it
+            print(f"   ⚠️  Thumbnail not cached: {e.reason}")
+            return
+        meta = {
+            'uuid': snapshot.uuid,
+            'frame': snapshot.frame,
+            'proxy': snapshot.proxy,
+            'suffix': suffix,
+            'build': build
+        }
+        try:
+            THUMBNAIL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Write through unique temp files and rename, so readers never see
+            # partial files and concurrent explorers can't swap each other's
+            with open(image_path, 'rb') as src:
+                _replace_file(THUMBNAIL_CACHE_DIR / f"{key}{suffix}", src)
+            _replace_file(THUMBNAIL_CACHE_DIR / f"{key}.json",
+                          io.BytesIO(json.dumps(meta).encode()))
+            _prune_thumbnail_cache()
+        except OSError as e:
+            print(f"   ⚠️  Thumbnail not cached: {e}")
+
+    def _save_thumbnail(self, response, output_path, snapshot):
+        """Save the raw snapshot response, returns the final file path"""
+        try:
+            resp_mime = response.headers.get('Content-Type')
+            
+            if resp_mime == 'image/jpeg' or resp_mime == 'image/png':
+                file_path = Path(output_path)
+                if resp_mime == 'image/png':
+                    output_path = file_path.with_suffix(".png")
+                if resp_mime == 'image/jpeg':
+                    output_path = file_path.with_suffix(".jpg")
+                # Stream to disk in chunks instead of buffering the image
+                with open(output_path, 'wb') as f:
+                    shutil.copyfileobj(response, f, 64 * 1024)
+                self._store_cached_thumbnail(snapshot, output_path)
+            
+            # Read what's left of the body (other content types), so the raw
+            # (_preload_content=False) response hands its keep-alive
+            # connection back to the pool for the next request
+            response.read()
+        except BaseException:
+            # Never reuse a connection with a half-read body
+            response.close()
+            raise
+        response.release_conn()
+        return output_path
+
     def generate_thumbnail(self, shot_uuid, frame=0, output_path=None):
         """Generate a thumbnail (snapshot) of a specific shot"""
         if output_path is None:
@@ -242,15 +458,10 @@ class AssimilateProjectExplorer:
             output_path = f"/tmp/thumbnail_{shot_uuid[:8]}_{timestamp}.jpg"
         
         try:
-            # Use ImageSnapshot model
-            snapshot = ImageSnapshot(
-                uuid=shot_uuid,
-                frame=frame,
-                proxy=True,
-                mime_type = "image/png"
-                #file=output_path
-                # Note: The API support direct file output, if 'file' is not pressent in ImageSnapShot we will handle the binary response ourselves
-            )
+            snapshot = self._snapshot_request(shot_uuid, frame)
+            cached = self._load_cached_thumbnail(snapshot, output_path)
+            if cached:
+                return cached
             
             # Swagger API call - returns JPEG binary
             response = self.application_api.do_application_render_snapshot(
@@ -259,60 +470,105 @@ class AssimilateProjectExplorer:
             )
             
             # Save the image
-            resp_mime = response.headers.get('Content-Type')
-            
-            if resp_mime == 'image/jpeg' or resp_mime == 'image/png':
-                file_path = Path(output_path)
-                if resp_mime == 'image/png':
-                    output_path = file_path.with_suffix(".png")
-                if resp_mime == 'image/jpeg':
-                    output_path = file_path.with_suffix(".jpg")
-                if hasattr(response, 'data'):
-                    with open(output_path, 'wb') as f:
-                        f.write(response.data)
-                        
-            return output_path
+            return self._save_thumbnail(response, output_path, snapshot)
         except ApiException as e:
             if e.body:
-                error_dict = json.loads(e.body.decode('utf-8'))
+                error_dict = json.loads(e.body)
                 print(f"   ⚠️  Thumbnail failed: {json.dumps(error_dict, indent=4)}")
             return None
 
+    def generate_thumbnails(self, shots, frame=0):
+        """Generate thumbnails for a list of shots concurrently"""
+        thumbnails = []
+        to_render = []
+        for i, shot in enumerate(shots):
+            print(f"   Generating thumbnail for: {shot['name']}...")
+            thumb_path = f"/tmp/project_thumb_{i}_{shot['uuid'][:8]}.jpg"
+            snapshot = self._snapshot_request(shot['uuid'], frame)
+            cached = self._load_cached_thumbnail(snapshot, thumb_path)
+            if cached:
+                thumbnails.append(cached)
+                print(f"      ✅ Saved (cached): {cached}")
+                continue
+            to_render.append((thumb_path, snapshot))
+        
+        if not to_render:
+            return thumbnails
+        
+        # Fire all requests first, so the server round trips overlap instead
+        # of running one by one. The pool is sized to the requests (up to the
+        # connection pool size), the client's async_req pool only has one
+        # thread per CPU
+        workers = min(len(to_render), self.config.connection_pool_maxsize)
+        error = None
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = []
+            for thumb_path, snapshot in to_render:
+                future = executor.submit(
+                    self.application_api.do_application_render_snapshot,
+                    body=snapshot,
+                    _preload_content=False  # Important: we want the raw response
+                )
+                pending.append((future, thumb_path, snapshot))
+            
+            # Read every response, even after a transport error, so all pooled
+            # connections are released; the first such error is raised at the end
+            for future, thumb_path, snapshot in pending:
+                try:
+                    result = self._save_thumbnail(future.result(), thumb_path, snapshot)
+                except ApiException as e:
+                    if e.body:
+                        error_dict = json.loads(e.body)
+                        print(f"   ⚠️  Thumbnail failed: {json.dumps(error_dict, indent=4)}")
+                    continue
+                except Exception as e:
+                    if error is None:
+                        error = e
+                    continue
+                thumbnails.append(result)
+                print(f"      ✅ Saved: {result}")
+        if error is not None:
+            raise error
+        return thumbnails
+
     # ============================================================
     # STEP 8: Render Queue management
     # ============================================================
     def get_render_queue(self):
         """Retrieve the current render queue"""
+        return self._show_render_queue(
+            self.application_api.get_application_render_queue)
+
+    def _show_render_queue(self, fetch_queue, note=None):
+        """Print the render queue returned by fetch_queue()"""
         print("\n⏳ Render queue status...")
         try:
-            queue = self.application_api.get_application_render_queue()
+            queue = fetch_queue()
+            if note:
+                print(f"   ({note})")
             
             if not queue:
                 print("   Queue is empty")
                 return []
             
+            lines = []
             for item in queue:
                 name = safe_get_attr(item, 'name', 'Unknown')
                 status = safe_get_attr(item, 'status', 'unknown')
                 
-                status_icon = {
-                    "Idle": "⚪",
-                    "waiting": "⏸️",
-                    "processing": "🔄",
-                    "finished": "✅",
-                    "error": "❌"
-                }.get(status, "❓")
+                status_icon = _STATUS_ICONS.get(status, "❓")
                 
                 frames_done = safe_get_attr(item, 'frames_done', 0)
                 frames_total = safe_get_attr(item, 'frames_total', 0)
                 
-                print(f"   {status_icon} {name}: {status} "
-                      f"({frames_done}/{frames_total} frames)")
+                lines.append(f"   {status_icon} {name}: {status} "
+                             f"({frames_done}/{frames_total} frames)")
+            sys.stdout.write("\n".join(lines) + "\n")
             return queue
             
         except ApiException as e:
             if e.body:
-                error_dict = json.loads(e.body.decode('utf-8'))
+                error_dict = json.loads(e.body)
                 print(f"❌ Error retrieving queue: {json.dumps(error_dict, indent=4)}")
             return []
     
@@ -338,7 +594,7 @@ class AssimilateProjectExplorer:
             
         except ApiException as e:
             if e.body:
-                error_dict = json.loads(e.body.decode('utf-8'))
+                error_dict = json.loads(e.body)
                 print(f"❌ Error adding: {json.dumps(error_dict, indent=4)}")
             raise
     
@@ -353,7 +609,7 @@ class AssimilateProjectExplorer:
             print("   ✅ Render queue started!")
         except ApiException as e:
             if e.body:
-                error_dict = json.loads(e.body.decode('utf-8'))
+                error_dict = json.loads(e.body)
                 print(f"❌ Error starting: {json.dumps(error_dict, indent=4)}")
             raise
 
@@ -370,7 +626,7 @@ class AssimilateProjectExplorer:
             print("\n▶️  Player mode activated")
         except ApiException as e:
             if e.body:
-                error_dict = json.loads(e.body.decode('utf-8'))
+                error_dict = json.loads(e.body)
                 print(f"❌ Error opening player: {json.dumps(error_dict, indent=4)}")
             raise
     
@@ -390,7 +646,7 @@ class AssimilateProjectExplorer:
             print(f"   Playback: {mode}, Loop: {loop}")
         except ApiException as e:
             if e.body:
-                error_dict = json.loads(e.body.decode('utf-8'))
+                error_dict = json.loads(e.body)
                 print(f"❌ Error setting playback: {json.dumps(error_dict, indent=4)}")
             raise
 
@@ -428,10 +684,7 @@ class AssimilateProjectExplorer:
             # Select target group
             target_group = None
             if target_group_name:
-                target_group = next((
-                    g for g in groups 
-                    if g.name == target_group_name
-                ), None)
+                target_group = self._groups_by_name.get(target_group_name)
             else:
                 target_group = groups[-1]
             
@@ -439,6 +692,12 @@ class AssimilateProjectExplorer:
                 print(f"❌ Group '{target_group_name}' not found!")
                 return False
             
+            # The render queue doesn't depend on the group selection, fetch
+            # it in the background while the group, timeline, shots and
+            # thumbnails are requested
+            queue_request = self.application_api.get_application_render_queue(
+                async_req=True
+            )
             self.select_group(target_group.uuid)
             
             # 5. Explore timeline
@@ -453,17 +712,11 @@ class AssimilateProjectExplorer:
             
             # 7. Generate thumbnails
             print("\n📸 Generating thumbnails...")
-            thumbnails = []
-            for i, shot in enumerate(shots[:5]):
-                print(f"   Generating thumbnail for: {shot['name']}...")
-                thumb_path = f"/tmp/project_thumb_{i}_{shot['uuid'][:8]}.jpg"
-                result = self.generate_thumbnail(shot['uuid'], frame=0, output_path=thumb_path)
-                if result:
-                    thumbnails.append(result)
-                    print(f"      ✅ Saved: {result}")
+            thumbnails = self.generate_thumbnails(shots[:5], frame=0)
             
             # 8. Check render queue
-            self.get_render_queue()
+            self._show_render_queue(queue_request.get,
+                                    "status when the group was selected")
             
             # 9. Open player
             print("\n👁️  Opening player for review...")
@@ -486,7 +739,7 @@ class AssimilateProjectExplorer:
             print(f"\n❌ API Error in workflow: {e.reason}")
             print(f"   Status code: {e.status}")
             if e.body:
-                error_dict = json.loads(e.body.decode('utf-8'))
+                error_dict = json.loads(e.body)
                 print(f"   Details: {json.dumps(error_dict, indent=4)}")
             return False
         except Exception as e:
@@ -495,6 +748,17 @@ class AssimilateProjectExplorer:
             traceback.print_exc()
             return False
 
+    def print_debug_info(self):
+        """Re-check the server and list the projects after a failed run"""
+        # Request the projects while the system info is retrieved
+        projects_request = self.projects_api.get_projects(async_req=True)
+        # Bypass the cache, this checks the server is still reachable
+        self.get_system_info(refresh=True)
+        projects = self._show_projects(projects_request.get)
+        if projects:
+            names = [p.name for p in projects]
+            print(f"\nAvailable projects: {names}")
+
 
 # ============================================================
 # USAGE EXAMPLE
@@ -509,11 +773,7 @@ if __name__ == "__main__":
     if not success:
         print("\n--- Debug info ---")
         try:
-            explorer.get_system_info()
-            projects = explorer.list_projects()
-            if projects:
-                names = [p.name for p in projects]
-                print(f"\nAvailable projects: {names}")
+            explorer.print_debug_info()
         except Exception as e:
             print(f"Debug failed: {e}")
     